@@ -31,6 +31,8 @@ TODO:
 """
 
 import collections
+import mmap
+import os
 import struct
 from math import isnan
 
@@ -42,6 +44,42 @@ MRC = 0
 SPIDER = 1
 UNKNOWNFORMAT = 2
 
+# Bounded cache of read-only mmaps used to probe headers, so repeated
+# dimension queries on the same stack (one per particle in tight loops)
+# decode straight from the mapped pages instead of paying an
+# open+read+close per call. Entries are validated against the file
+# stat, so in-place edits or stack growth trigger a remap.
+_MAX_HEADER_MMAPS = 64
+_headerMmaps = collections.OrderedDict()
+
+
+def _getHeaderBuffer(fileName, nBytes):
+    """ Return a buffer with (at least) the first nBytes of fileName,
+    backed by a cached read-only mmap when the file can be mapped.
+    """
+    try:
+        st = os.stat(fileName)
+        key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        entry = _headerMmaps.get(fileName, None)
+
+        if entry is not None and entry[1] == key:
+            return entry[0]
+
+        with open(fileName, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if entry is not None:
+            entry[0].close()
+        while len(_headerMmaps) >= _MAX_HEADER_MMAPS:
+            _, (oldMm, _) = _headerMmaps.popitem(last=False)
+            oldMm.close()
+        _headerMmaps[fileName] = (mm, key)
+        return mm
+    except (OSError, ValueError):
+        # Empty or non-mappable files: fall back to a plain read
+        with open(fileName, 'rb') as f:
+            return f.read(nBytes)
+
 
 class Ccp4Header:
     ORIGIN = 0  # save coordinate origin in the mrc header field=Origin (Angstrom)
@@ -248,11 +286,9 @@ class Ccp4Header:
         return x, y, z, n
 
     def readHeader(self):
-        # read header
-        f = open(self._name, 'rb')
-        s = f.read(52 * 4)  # read header from word 0 to 51
-        f.close()
-        a = struct.unpack(self.chain, s)
+        # decode header words 0 to 51, from a cached mmap if possible
+        s = _getHeaderBuffer(self._name, 52 * 4)
+        a = struct.unpack_from(self.chain, s)
 
         # fill dicionary
         self._header['NC'] = a[0]
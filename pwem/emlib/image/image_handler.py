@@ -39,6 +39,12 @@ class ImageHandler(object):
 
     # TODO: remove dependency from Xmipp
 
+    # Cache of header dimensions shared by all handler instances,
+    # keyed by (filename, mtime, size), so loops asking the dimensions
+    # of every item of a stack only parse the header once.
+    _dimsCache = {}
+    _DIMS_CACHE_LIMIT = 1024
+
     def __init__(self):
         # Now it will use Xmipp image library
         # to read and write most of formats, in the future
@@ -227,41 +233,70 @@ class ImageHandler(object):
     def getDimensions(self, locationObj):
         """ It will return a tuple with the images dimensions.
         The tuple will contains:
-            (x, y, z, n) where x, y, z are image dimensions (z=1 for 2D) and 
+            (x, y, z, n) where x, y, z are image dimensions (z=1 for 2D) and
             n is the number of elements if stack.
+
+        Results are memoized by (filename, mtime, size), so repeated
+        queries over the items of the same stack do not re-read the
+        header.
         """
         if self.existsLocation(locationObj):
             location = self._convertToLocation(locationObj)
             fn = location[1]
-            ext = pwutils.getExt(fn).lower()
 
-            # Local import to avoid import loop between ImageHandler and Ccp4Header.
-            from pwem.convert import headers
+            try:
+                st = os.stat(fn.split(':')[0])
+                cacheKey = (fn, st.st_mtime_ns, st.st_size)
+            except OSError:
+                cacheKey = None
 
-            if ext == '.png' or ext == '.jpg':
-                im = Image.open(fn)
-                x, y = im.size  # (width,height) tuple
-                return x, y, 1, 1
+            if cacheKey is not None:
+                dims = self._dimsCache.get(cacheKey, None)
+                if dims is not None:
+                    return dims
 
-            elif headers.getFileFormat(fn) == headers.MRC:
-                header = headers.Ccp4Header(fn, readHeader=True)
-                return header.getXYZN()
+            dims = self.__computeDimensions(location)
 
-            elif ext == '.img':
-                # FIXME Since now we can not read dm4 format in Scipion natively
-                # or recent .img format
-                # we are opening an Eman2 process to read the dm4 file
-                from pwem import Domain
-                getImageDimensions = Domain.importFromPlugin(
-                    'eman2.convert', 'getImageDimensions',
-                    doRaise=True)
-                return getImageDimensions(fn)  # we are ignoring index here
-            else:
-                self._img.read(location, lib.HEADER)
-                return self._img.getDimensions()
+            if cacheKey is not None:
+                if len(self._dimsCache) >= self._DIMS_CACHE_LIMIT:
+                    self._dimsCache.clear()
+                self._dimsCache[cacheKey] = dims
+
+            return dims
         else:
             return None, None, None, None
 
+    def __computeDimensions(self, location):
+        """ Read the dimensions tuple from the file header
+        (see getDimensions). """
+        fn = location[1]
+        ext = pwutils.getExt(fn).lower()
+
+        # Local import to avoid import loop between ImageHandler and Ccp4Header.
+        from pwem.convert import headers
+
+        if ext == '.png' or ext == '.jpg':
+            im = Image.open(fn)
+            x, y = im.size  # (width,height) tuple
+            return x, y, 1, 1
+
+        elif headers.getFileFormat(fn) == headers.MRC:
+            header = headers.Ccp4Header(fn, readHeader=True)
+            return header.getXYZN()
+
+        elif ext == '.img':
+            # FIXME Since now we can not read dm4 format in Scipion natively
+            # or recent .img format
+            # we are opening an Eman2 process to read the dm4 file
+            from pwem import Domain
+            getImageDimensions = Domain.importFromPlugin(
+                'eman2.convert', 'getImageDimensions',
+                doRaise=True)
+            return getImageDimensions(fn)  # we are ignoring index here
+        else:
+            self._img.read(location, lib.HEADER)
+            return self._img.getDimensions()
+
     def getDataType(self, locationObj):
         if self.existsLocation(locationObj):
             location = self._convertToLocation(locationObj)
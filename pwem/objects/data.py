@@ -31,6 +31,8 @@ for EM data objects like: Image, SetOfImage and others
 
 import os
 import json
+import sys
+
 import numpy as np
 
 from pyworkflow.object import (Object, Float, Integer, String,
@@ -70,7 +72,15 @@ class Acquisition(EMObject):
         self.opticsGroupInfo = String()
 
     def copyInfo(self, other):
-        self.copy(other, copyId=False)
+        # Direct scalar copies are noticeably cheaper than the
+        # reflective copy() when acquisitions are copied per image
+        self._magnification.set(other._magnification.get())
+        self._voltage.set(other._voltage.get())
+        self._sphericalAberration.set(other._sphericalAberration.get())
+        self._amplitudeContrast.set(other._amplitudeContrast.get())
+        self._doseInitial.set(other._doseInitial.get())
+        self._dosePerFrame.set(other._dosePerFrame.get())
+        self.opticsGroupInfo.set(other.opticsGroupInfo.get())
 
     def getMagnification(self):
         return self._magnification.get()
@@ -126,7 +136,6 @@ class CTFModel(EMObject):
         self._defocusAngle = Float(kwargs.get('defocusAngle', None))
         self._defocusRatio = Float()
         self._phaseShift = Float(kwargs['phaseShift']) if 'phaseShift' in kwargs else None
-        self._defocusRatio = Float()
         self._psdFile = String()
         self._micObj = None
         self._resolution = Float()
@@ -198,9 +207,19 @@ class CTFModel(EMObject):
         return self._defocusRatio.get()
 
     def copyInfo(self, other):
-        self.copyAttributes(other, '_defocusU', '_defocusV', '_defocusAngle',
-                            '_defocusRatio', '_psdFile', '_micFile',
-                            '_resolution', '_fitQuality')
+        # Inline the scalar copies instead of going through the
+        # string-driven copyAttributes; CTFs are copied once per
+        # particle when transferring sets
+        self._defocusU.set(other._defocusU.get())
+        self._defocusV.set(other._defocusV.get())
+        self._defocusAngle.set(other._defocusAngle.get())
+        self._defocusRatio.set(other._defocusRatio.get())
+        self._psdFile.set(other._psdFile.get())
+        self._resolution.set(other._resolution.get())
+        self._fitQuality.set(other._fitQuality.get())
+        # _micFile is an optional extra attribute set by some plugins
+        if hasattr(other, '_micFile'):
+            self.copyAttributes(other, '_micFile')
         if other.hasPhaseShift():
             self.setPhaseShift(other.getPhaseShift())
 
@@ -476,6 +495,11 @@ class Image(EMObject):
 
     def setFileName(self, filename):
         """ Use the _objValue attribute to store filename. """
+        # Intern the path: all particles of a stack share the same
+        # filename, so a million items reference one string object
+        # instead of keeping a million equal copies alive
+        if isinstance(filename, str):
+            filename = sys.intern(filename)
         self._filename.set(filename)
 
     def getLocation(self):
@@ -512,7 +536,7 @@ class Image(EMObject):
 
     def copyInfo(self, other):
         """ Copy basic information """
-        self.copyAttributes(other, '_samplingRate')
+        self._samplingRate.set(other._samplingRate.get())
 
     def copyLocation(self, other):
         """ Copy location index and filename from other image. """
@@ -876,6 +900,90 @@ class PdbFile(AtomStruct):
 class EMSet(Set, EMObject):
     _classesDict = None
 
+    # Maximum number of items kept in the random-access cache
+    # used by __getitem__
+    ITEM_CACHE_LIMIT = 4096
+
+    def __getitem__(self, itemId):
+        """ Get the item with the given id, memoizing it in a bounded
+        FIFO cache. Repeated lookups of the same item (common in
+        viewers and picking loops) skip the database round trip.
+        Clones are stored and returned, so callers cannot corrupt the
+        cached entries.
+        """
+        cache = self._getItemCache()
+        # Dictionary lookups ({attrName: value}) are not cached
+        key = None if isinstance(itemId, dict) else itemId
+
+        if key is not None and key in cache:
+            return cache[key].clone(copyEnable=True)
+
+        item = Set.__getitem__(self, itemId)
+
+        # Set items (e.g. Class2D in a SetOfClasses) override clone()
+        # without the copyEnable parameter and hold live mappers, so
+        # they are returned uncached, as before the cache existed
+        if (key is not None and item is not None
+                and not isinstance(item, EMSet)):
+            if len(cache) >= self.ITEM_CACHE_LIMIT:
+                cache.popitem(last=False)  # FIFO eviction
+            # clone defaults to copyEnable=False, which would turn
+            # disabled items enabled on cache hits
+            cache[key] = item.clone(copyEnable=True)
+
+        return item
+
+    def _getItemCache(self):
+        cache = getattr(self, '_itemCache', None)
+        if cache is None:
+            cache = OrderedDict()
+            self._itemCache = cache
+        return cache
+
+    def _invalidateItemCache(self):
+        if getattr(self, '_itemCache', None):
+            self._itemCache.clear()
+
+    def configureFastWrites(self, synchronous='NORMAL'):
+        """ Relax the sqlite durability settings of the open connection
+        for bulk ingestion: with the default synchronous mode every
+        commit waits for an fsync, which dominates when a protocol
+        populates a large set. Call it right after creating the set and
+        before appending; the pragmas last for this connection only.
+
+        :param synchronous: sqlite synchronous mode to set, NORMAL by
+            default (use OFF for scratch sets that can be recomputed).
+        """
+        mapper = self._getMapper()
+        db = getattr(mapper, 'db', None)
+        if db is not None:
+            db.executeCommand('PRAGMA synchronous=%s' % synchronous)
+            db.executeCommand('PRAGMA temp_store=MEMORY')
+            db.executeCommand('PRAGMA cache_size=-65536')
+
+    def refreshSize(self):
+        """ Update the cached _size with a single COUNT(*) query.
+
+        The cached value is set when the set is loaded and incremented
+        on append, but for streaming sets populated by another process
+        it can lag behind what is already in the database. This avoids
+        a full reload just to get an up-to-date size.
+        """
+        self._size.set(self._getMapper().count())
+        return self._size.get()
+
+    def update(self, item):
+        self._invalidateItemCache()
+        Set.update(self, item)
+
+    def load(self):
+        self._invalidateItemCache()
+        Set.load(self)
+
+    def clear(self):
+        self._invalidateItemCache()
+        Set.clear(self)
+
     def _loadClassesDict(self):
 
         if self._classesDict is None:
@@ -943,6 +1051,130 @@ class EMSet(Set, EMObject):
     def getFiles(self):
         return Set.getFiles(self)
 
+    def _prepareItem(self, item):
+        """ Hook called for each item before it is inserted in the set.
+        Subclasses can override it to propagate set properties
+        (e.g. sampling rate or acquisition) to the items.
+        """
+        pass
+
+    def appendMany(self, items, batchSize=1000):
+        """ Append a batch of items inside a single transaction.
+
+        This is equivalent to calling append() for each item, but rows
+        are accumulated and submitted through cursor.executemany, so
+        the per-statement overhead of the mapper is amortized across
+        the batch. Use it when populating large sets in a loop.
+
+        Params:
+            items: any iterable of items of this set ITEM_TYPE.
+            batchSize: number of rows accumulated before flushing
+                them to the database.
+        """
+        mapper = self._getMapper()
+        db = getattr(mapper, 'db', None)
+        rows = []
+
+        def _flush():
+            db.cursor.executemany(db.INSERT_OBJECT, rows)
+            del rows[:]
+
+        for item in items:
+            self._prepareItem(item)
+
+            if db is None or mapper.doCreateTables or db.INSERT_OBJECT is None:
+                # First item creates the tables and the prepared INSERT
+                # command that is reused for the batched rows. Mappers
+                # without a flat db backend just insert item by item.
+                Set.append(self, item)
+                continue
+
+            if not item.hasObjId():
+                self._idCount += 1
+                item.setObjId(self._idCount)
+            else:
+                self._idCount = max(self._idCount, item.getObjId())
+
+            rows.append([item.getObjId(), item.isEnabled(),
+                         item.getObjLabel(), item.getObjComment()]
+                        + list(mapper._getValuesFromObject(item).values()))
+            if len(rows) >= batchSize:
+                _flush()
+            self._size.increment()
+
+        if rows:
+            _flush()
+        mapper.commit()
+
+    def getColumnValues(self, attributes, where=None,
+                        orderBy=None, direction='ASC'):
+        """ Return the values of one or several item attributes fetched
+        column-wise from the underlying database, without building one
+        item object (and its boxed attribute values) per row.
+
+        It follows the same contract as getUniqueValues, but returning
+        every row: a plain list for a single attribute, or a dictionary
+        {attribute: list of values} when a list is passed.
+
+        :param attributes: item attribute/s to retrieve (e.g. '_filename')
+        :param where: optional condition to filter the rows
+        :param orderBy: optional attribute (or 'id') to sort the rows by
+        :param direction: sort direction, 'ASC' or 'DESC'
+        """
+        singleLabel = isinstance(attributes, str)
+        labels = [attributes] if singleLabel else attributes
+
+        mapper = self._getMapper()
+        db = getattr(mapper, 'db', None)
+
+        if db is None:  # mappers without a flat db backend
+            result = {label: [] for label in labels}
+            for item in self.iterItems(where=where, orderBy=orderBy or 'id',
+                                       direction=direction):
+                for label in labels:
+                    result[label].append(item.getAttributeValue(label))
+        else:
+            cols = ', '.join('%s AS %s' % (db._getRealCol(label), label)
+                             for label in labels)
+            sqlCommand = 'SELECT %s %s' % (cols, db.FROM)
+            whereStr = db._whereToWhereStr(where)
+            if whereStr is not None:
+                sqlCommand += ' WHERE ' + whereStr
+            if orderBy is not None:
+                orderCol = 'id' if orderBy == 'id' else db._getRealCol(orderBy)
+                sqlCommand += ' ORDER BY %s %s' % (orderCol, direction)
+
+            db.executeCommand(sqlCommand)
+            rows = db.cursor.fetchall()
+            result = {label: [row[label] for row in rows]
+                      for label in labels}
+
+        return result[labels[0]] if singleLabel else result
+
+    def getIdsArray(self, where=None):
+        """ Return the item ids as a compact numpy int array, fetched
+        with a single SELECT. Unlike getIdSet, no per-id Python object
+        is kept alive, so membership tests and joins over millions of
+        items can be done with vectorized numpy operations.
+
+        :param where: optional condition to filter the rows
+        """
+        mapper = self._getMapper()
+        db = getattr(mapper, 'db', None)
+
+        if db is None:  # mappers without a flat db backend
+            return np.fromiter((item.getObjId() for item in
+                                self.iterItems(where=where)), dtype=int)
+
+        sqlCommand = 'SELECT id %s' % db.FROM
+        whereStr = db._whereToWhereStr(where)
+        if whereStr is not None:
+            sqlCommand += ' WHERE ' + whereStr
+
+        db.executeCommand(sqlCommand)
+        return np.fromiter((row[0] for row in db.cursor.fetchall()),
+                           dtype=int)
+
 
 class SetOfImages(EMSet):
     """ Represents a set of Images """
@@ -1017,6 +1249,11 @@ class SetOfImages(EMSet):
 
     def append(self, image):
         """ Add a image to the set. """
+        self._prepareItem(image)
+        EMSet.append(self, image)
+
+    def _prepareItem(self, image):
+        """ Propagate set properties to the image before insertion. """
         # If the sampling rate was set before, the same value
         # will be set for each image added to the set
         if self.getSamplingRate() or not image.getSamplingRate():
@@ -1034,8 +1271,6 @@ class SetOfImages(EMSet):
         if self.isEmpty():
             self._setFirstDim(image)
 
-        EMSet.append(self, image)
-
     def _setFirstDim(self, image):
         """ Store dimensions when the first image is found.
         This function should be called only once, to avoid reading
@@ -1046,17 +1281,16 @@ class SetOfImages(EMSet):
     def copyInfo(self, other):
         """ Copy basic information (sampling rate and ctf)
         from other set of images to current one"""
-        self.copyAttributes(other, '_samplingRate', '_isPhaseFlipped',
-                            '_isAmplitudeCorrected', '_alignment')
+        self._samplingRate.set(other._samplingRate.get())
+        self._isPhaseFlipped.set(other._isPhaseFlipped.get())
+        self._isAmplitudeCorrected.set(other._isAmplitudeCorrected.get())
+        self._alignment.set(other._alignment.get())
         self._acquisition.copyInfo(other._acquisition)
 
     def getFiles(self):
-        filePaths = set()
-        uniqueFiles = self.aggregate(['count'], '_filename', ['_filename'])
-
-        for row in uniqueFiles:
-            filePaths.add(row['_filename'])
-        return filePaths
+        # SELECT DISTINCT on the filename column; no counting and
+        # no item objects involved
+        return set(self.getUniqueValues('_filename'))
 
     def setDownsample(self, downFactor):
         """ Update the values of samplingRate and scannedPixelSize
@@ -1071,6 +1305,31 @@ class SetOfImages(EMSet):
     def getSamplingRate(self):
         return self._samplingRate.get()
 
+    def updateItemsSamplingRate(self, samplingRate):
+        """ Set the sampling rate of the set and rewrite the
+        _samplingRate column of every stored item with a single SQL
+        UPDATE, instead of reading, modifying and updating the items
+        one by one.
+        """
+        self.setSamplingRate(samplingRate)
+
+        mapper = self._getMapper()
+        db = getattr(mapper, 'db', None)
+
+        if db is None:  # mappers without a flat db backend
+            for img in self.iterItems():
+                img.setSamplingRate(samplingRate)
+                self.update(img)
+        else:
+            db.executeCommand('UPDATE %sObjects SET %s=?'
+                              % (db.tablePrefix,
+                                 db._getRealCol('_samplingRate')),
+                              (samplingRate,))
+            # Persist right away: callers are not required to write()
+            # after this and the update would be lost on close
+            mapper.commit()
+            self._invalidateItemCache()
+
     def writeStack(self, fnStack, orderBy='id', direction='ASC',
                    applyTransform=False):
         # TODO create empty file to improve efficiency
@@ -1434,6 +1693,11 @@ class SetOfCoordinates(EMSet):
     ITEM_TYPE = Coordinate
 
     def __init__(self, **kwargs):
+        # Index the _micId column by default, so the per-micrograph
+        # filter used in iterCoordinates is an indexed lookup and not
+        # a full scan, also for sets not created through the protocol
+        # _createSetOfCoordinates factory.
+        kwargs.setdefault('indexes', ['_micId'])
         EMSet.__init__(self, **kwargs)
         self._micrographsPointer = Pointer()
         self._boxSize = Integer()
@@ -1495,6 +1759,45 @@ class SetOfCoordinates(EMSet):
         else:
             self._micrographsPointer.set(micrographs)
 
+    def getCoordinatesArrays(self, micrograph=None):
+        """ Return the positions of the set as three parallel numpy
+        arrays (x, y, micId), fetched column-wise from the database.
+        This avoids building one boxed Coordinate object per row and
+        allows vectorized operations downstream. Coordinates stored
+        without a micrograph id get -1 in the micId array.
+
+        :param micrograph: if not None, restrict the result to the
+            coordinates belonging to that micrograph (object or id).
+        """
+        if micrograph is None:
+            where = None
+        elif isinstance(micrograph, int):
+            where = '_micId=%d' % micrograph
+        else:
+            where = '_micId=%d' % micrograph.getObjId()
+
+        columns = self.getColumnValues(['_x', '_y', '_micId'], where=where)
+
+        # _micId is optional and comes back as None for coordinates
+        # stored without a micrograph; map those to -1
+        micIds = [-1 if micId is None else micId
+                  for micId in columns['_micId']]
+
+        return (np.asarray(columns['_x'], dtype=int),
+                np.asarray(columns['_y'], dtype=int),
+                np.asarray(micIds, dtype=int))
+
+    def getPositionsArray(self, micrograph=None):
+        """ Return the positions packed in one contiguous (N, 3) int32
+        array with columns (x, y, micId): 12 bytes per coordinate, and
+        per-micrograph selection becomes a numpy mask
+        (arr[arr[:, 2] == micId]) instead of one query or one Python
+        comparison per coordinate.
+        """
+        x, y, micId = self.getCoordinatesArrays(micrograph)
+        return np.stack([x, y, micId], axis=1).astype(np.int32,
+                                                      copy=False)
+
     def getFiles(self):
         filePaths = set()
         filePaths.add(self.getFileName())
@@ -1521,10 +1824,16 @@ class SetOfCoordinates(EMSet):
         # acquisition in SetOfImages
 
 
+# Template for the 4x4 identity used when instantiating transformation
+# matrices; copying it is cheaper than building a fresh np.eye(4) for
+# every Matrix, and EM pipelines create one per particle alignment.
+_IDENTITY_MATRIX = np.eye(4)
+
+
 class Matrix(Scalar):
     def __init__(self, **kwargs):
         Scalar.__init__(self, **kwargs)
-        self._matrix = np.eye(4)
+        self._matrix = _IDENTITY_MATRIX.copy()
 
     def _convertValue(self, value):
         """Value should be a str with comma separated values
@@ -1623,6 +1932,15 @@ class Transform(EMObject):
         new_matrix = matrix * self.getMatrix()
         self._matrix.setMatrix(new_matrix)
 
+    @classmethod
+    def stack(cls, transforms):
+        """ Return the matrices of a list of transforms stacked in a
+        single contiguous (N, 4, 4) numpy array, so that batched
+        operations (e.g. np.matmul over all particle alignments) can
+        replace per-Transform Python loops.
+        """
+        return np.stack([t.getMatrix() for t in transforms])
+
 
 class Class2D(SetOfParticles):
     """ Represent a Class that groups Particles objects.
@@ -1741,6 +2059,13 @@ class SetOfClasses(EMSet):
         EMSet._insertItem(self, classItem)
         classItem.write(properties=False)  # Set.write(self)
 
+    def appendMany(self, items, batchSize=1000):
+        """ Classes need the per-item mapper path setup done in
+        _insertItem, so batched row inserts do not apply here.
+        """
+        for classItem in items:
+            self.append(classItem)
+
     def __getitem__(self, itemId):
         """ Setup the mapper classes before returning the item. """
         classItem = EMSet.__getitem__(self, itemId)
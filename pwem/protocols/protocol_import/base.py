@@ -26,7 +26,8 @@
 
 import os
 from os.path import join
-from glob import glob
+import fnmatch
+import glob
 import re
 from datetime import datetime
 
@@ -227,12 +228,47 @@ class ProtImportFiles(ProtImport):
         if pattern is None:
             pattern = self.getPattern()
 
-        filePaths = glob(pattern)
+        filePaths = self._findMatchingFiles(pattern)
         filePaths.sort()
         self.numberOfFiles = len(filePaths)
 
         return filePaths
 
+    def _findMatchingFiles(self, pattern):
+        """ List the paths matching the pattern.
+        When the directory part of the pattern has no wildcards, scan it
+        directly with os.scandir and a precompiled regex, which is much
+        lighter than glob on directories with many thousands of entries.
+        Fall back to glob for patterns with wildcards in the path.
+        """
+        dirName = os.path.dirname(pattern)
+        baseName = os.path.basename(pattern)
+
+        if glob.has_magic(dirName) or not os.path.isdir(dirName):
+            return glob.glob(pattern)
+
+        # The directory mtime changes whenever entries are added or
+        # removed, so it is a safe stamp to skip re-scanning. This
+        # matters in streaming mode, where the pattern is polled
+        # every few seconds.
+        dirStamp = os.stat(dirName).st_mtime_ns
+        cached = getattr(self, '_matchCache', None)
+
+        if cached is not None and cached[0] == (pattern, dirStamp):
+            return list(cached[1])
+
+        regex = re.compile(fnmatch.translate(baseName))
+        # Like glob, do not match hidden files unless explicitly asked
+        skipHidden = not baseName.startswith('.')
+
+        filePaths = [entry.path for entry in os.scandir(dirName)
+                     if regex.match(entry.name) and
+                     not (skipHidden and entry.name.startswith('.'))]
+
+        self._matchCache = ((pattern, dirStamp), filePaths)
+
+        return list(filePaths)
+
     def getCopyOrLink(self):
         # Set a function to copyFile or createLink
         # depending in the user selected option 
@@ -31,6 +31,7 @@ import re
 
 from os.path import exists, isdir
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta, datetime
 
 import pyworkflow.utils as pwutils
@@ -119,9 +120,10 @@ class ProtImportImages(ProtImportFiles):
         
         createSetFunc = getattr(self, '_create' + self._outputClassName)
         imgSet = createSetFunc()
+        imgSet.configureFastWrites()
         imgSet.setIsPhaseFlipped(self.haveDataBeenPhaseFlipped.get())
         acquisition = imgSet.getAcquisition()
-        
+
         self.fillAcquisition(acquisition)
         
         # Call a function that should be implemented by each subclass
@@ -135,7 +137,8 @@ class ProtImportImages(ProtImportFiles):
         copyOrLink = self.getCopyOrLink()
         alreadyWarned = False  # Use this flag to warn only once
 
-        for i, (fileName, fileId) in enumerate(self.iterFiles()):
+        fileList = []
+        for fileName, fileId in self.iterFiles():
             if self.isBlacklisted(fileName):
                 continue
             uniqueFn = self._getUniqueFileName(fileName)
@@ -146,27 +149,49 @@ class ProtImportImages(ProtImportFiles):
                     self.warning('Removing white spaces from copies/symlinks.')
                     alreadyWarned = True
                 dst = dst.replace(' ', '')
+            fileList.append((fileName, fileId, uniqueFn, dst))
+
+        def _transferFile(fileName, dst):
             copyOrLink(fileName, dst)
             # Handle special case of Imagic images, copying also .img or .hed
             self.handleImgHed(copyOrLink, fileName, dst)
-            
-            if self._checkStacks:
-                _, _, _, n = imgh.getDimensions(dst)
-                
+
+        # Copying files is I/O bound, so overlap the transfers in a small
+        # thread pool. Creating links is cheap and is done serially.
+        if self.copyFiles and len(fileList) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(fileList))) as pool:
+                futures = [pool.submit(_transferFile, fileName, dst)
+                           for fileName, _, _, dst in fileList]
+                for future in futures:
+                    future.result()
+        else:
+            for fileName, _, _, dst in fileList:
+                _transferFile(fileName, dst)
+
+        # Bind the loop invariants to locals, the loop may run once
+        # per frame of every imported stack
+        checkStacks = self._checkStacks
+        getDimensions = imgh.getDimensions
+        addImageToSet = self._addImageToSet
+
+        for i, (fileName, fileId, uniqueFn, dst) in enumerate(fileList):
+            if checkStacks:
+                _, _, _, n = getDimensions(dst)
+
             if n > 1:
                 for index in range(1, n+1):
                     img.cleanObjId()
                     img.setMicId(fileId)
                     img.setFileName(dst)
                     img.setIndex(index)
-                    self._addImageToSet(img, imgSet)
+                    addImageToSet(img, imgSet)
             else:
                 img.setObjId(fileId)
                 img.setFileName(dst)
                 # Fill the micName if img is either Micrograph or Movie
                 uniqueFn = uniqueFn.replace(' ', '')
                 self._fillMicName(img, uniqueFn)
-                self._addImageToSet(img, imgSet)
+                addImageToSet(img, imgSet)
 
             outFiles.append(dst)
             
@@ -199,6 +224,8 @@ class ProtImportImages(ProtImportFiles):
             imgSet.loadAllProperties()
             self._fillImportedFiles(imgSet)
             imgSet.enableAppend()
+
+        imgSet.configureFastWrites()
         
         pointerExcludedMovs = getattr(self, 'moviesToExclude', None)
         if pointerExcludedMovs is not None:
@@ -28,7 +28,7 @@
 # *
 # **************************************************************************
 
-from os.path import exists, getmtime
+from os.path import exists, getmtime, join
 from datetime import datetime
 from collections import OrderedDict
 
@@ -554,11 +554,13 @@ class ProtCTFMicrographs(ProtMicrographs):
             return
         # Load previously done items (from text file)
         doneList = self._readDoneList()
-        # Check for newly done items
+        # Check for newly done items; probe membership against a set,
+        # this runs once per micrograph on every streaming poll
+        doneSet = set(doneList)
         listOfMics = self.micDict.values()
         nMics = len(listOfMics)
         newDone = [m for m in listOfMics
-                   if m.getObjId() not in doneList and self._isMicDone(m)]
+                   if m.getObjId() not in doneSet and self._isMicDone(m)]
 
         # Update the file with the newly done mics
         # or exit from the function if no new done mics
@@ -723,7 +725,12 @@ class ProtCTFMicrographs(ProtMicrographs):
 
     def _getMicrographDone(self, mic):
         """ Return the file that is used as a flag of termination. """
-        return self._getExtraPath('DONE', 'mic_%06d.TXT' % mic.getObjId())
+        # Cache the DONE dir prefix, this runs for every micrograph
+        # on each streaming check
+        doneDir = getattr(self, '_doneDir', None)
+        if doneDir is None:
+            doneDir = self._doneDir = self._getExtraPath('DONE')
+        return join(doneDir, 'mic_%06d.TXT' % mic.getObjId())
 
     def _writeFailedList(self, micList):
         """ Write to a text file the items that have failed. """
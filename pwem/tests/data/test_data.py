@@ -685,6 +685,55 @@ class TestSetOfCoordinates(BaseTest):
     def setUpClass(cls):
         setupTestOutput(cls)
 
+    def test_appendMany(self):
+        """ appendMany should be equivalent to a loop of appends. """
+        coordSet = emobj.SetOfCoordinates(filename=":memory:")
+        coordSet.appendMany(emobj.Coordinate(x=i, y=i + 1)
+                            for i in range(100))
+        coordSet.write()
+
+        self.assertEqual(100, coordSet.getSize())
+        for i, coord in enumerate(coordSet.iterItems()):
+            self.assertEqual(i + 1, coord.getObjId())
+            self.assertEqual(i, coord.getX())
+            self.assertEqual(i + 1, coord.getY())
+
+        # appending after a batched insert should continue the ids
+        coord = emobj.Coordinate(x=100, y=101)
+        coordSet.append(coord)
+        self.assertEqual(101, coord.getObjId())
+
+    def test_itemCacheKeepsEnabled(self):
+        """ Cached item lookups must preserve the enabled flag:
+        clone() defaults to copyEnable=False, so a careless cache
+        would return disabled items as enabled on cache hits. """
+        coordSet = emobj.SetOfCoordinates(filename=":memory:")
+        coordSet.appendMany(emobj.Coordinate(x=i, y=i)
+                            for i in range(5))
+        coord = coordSet[3]
+        coord.setEnabled(False)
+        coordSet.update(coord)
+
+        # Both the first (cache-store) and repeated (cache-hit)
+        # lookups must report the item as disabled
+        for _ in range(3):
+            self.assertFalse(coordSet[3].isEnabled())
+
+    def test_coordinatesArraysWithoutMicId(self):
+        """ Coordinates stored without a micId (a valid state, _micId
+        is optional) should come back as -1 in the micId array. """
+        coordSet = emobj.SetOfCoordinates(filename=":memory:")
+        coordSet.appendMany(emobj.Coordinate(x=i, y=i + 1)
+                            for i in range(10))
+        coordSet.write()
+
+        x, y, micId = coordSet.getCoordinatesArrays()
+        self.assertEqual(10, len(x))
+        self.assertTrue((micId == -1).all())
+
+        positions = coordSet.getPositionsArray()
+        self.assertEqual((10, 3), positions.shape)
+
     def test_mapper(self):
         """ test that indexes are created when a
         setOfCoordinates is created """
@@ -857,6 +906,40 @@ class TestSetOfClasses2D(BaseTest):
         clsSet.clear()  # Close db connection and clean data
 
 
+class TestSetOfClassesItemAccess(BaseTest):
+    """ Item lookups on class sets, whose items are sets themselves
+    (no external dataset needed). """
+
+    @classmethod
+    def setUpClass(cls):
+        setupTestOutput(cls)
+
+    def test_getItem(self):
+        imgSet = emobj.SetOfParticles(
+            filename=self.getOutputPath('images.sqlite'))
+        imgSet.setSamplingRate(1.0)
+        img = emobj.Particle()
+        for i in range(1, 5):
+            img.setLocation(i, 'images.stk')
+            imgSet.append(img)
+            img.cleanObjId()
+        imgSet.write()
+
+        classes = emobj.SetOfClasses2D(
+            filename=self.getOutputPath('classes2D.sqlite'))
+        classes.setImages(imgSet)
+        cls2D = emobj.Class2D()
+        classes.append(cls2D)
+        classes.write()
+
+        # Class items override clone() without the copyEnable
+        # parameter, so they must bypass the item cache; repeated
+        # lookups exercise both the miss and would-be-hit paths
+        for _ in range(2):
+            item = classes[cls2D.getObjId()]
+            self.assertIsInstance(item, emobj.Class2D)
+
+
 class TestTransform(BaseTest):
 
     def test_scale(self):
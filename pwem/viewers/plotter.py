@@ -24,10 +24,9 @@
 # *
 # **************************************************************************
 
-from math import radians
+import os
+
 import numpy as np
-import matplotlib.cm as cm
-from scipy.ndimage.filters import gaussian_filter
 
 from pyworkflow.gui.plotter import Plotter, plt
 import pwem.emlib.metadata as md
@@ -45,24 +44,37 @@ class EmPlotter(Plotter):
                                 min_p=5, color='blue'):
         """ Create an special type of subplot, representing the angular
         distribution of weight projections. """
-        if weight:
-            max_w = max(weight)
-            min_w = min(weight)
+        # A single scatter call creates one artist for all the points,
+        # instead of one per projection as a plot-per-point loop would
+        rot = np.asarray(rot, dtype=np.float64)
+        tilt = np.asarray(tilt, dtype=np.float64)
+
+        if weight is not None and len(weight):
+            weight = np.asarray(weight, dtype=np.float64)
+            max_w = weight.max()
+            min_w = weight.min()
             a = self.createSubPlot(title,
-                                   'Min weight=%(min_w).2f, Max weight=%(max_w).2f'
-                                   % locals(), '', projection='polar')
-            for r, t, w in zip(rot, tilt, weight):
-                pointsize = int((w - min_w) / (max_w - min_w + 0.001) * (max_p - min_p) + min_p)
-                a.plot(r, t, markerfacecolor=color, marker='.', markersize=pointsize)
+                                   'Min weight=%.2f, Max weight=%.2f'
+                                   % (min_w, max_w), '', projection='polar')
+            pointsizes = ((weight - min_w) / (max_w - min_w + 0.001)
+                          * (max_p - min_p) + min_p)
+            # scatter sizes are in points^2, markersize was in points
+            a.scatter(rot, tilt, s=pointsizes ** 2, c=color, marker='.',
+                      rasterized=True)
         else:
             a = self.createSubPlot(title, 'Empty plot', '', projection='polar')
-            for r, t in zip(rot, tilt):
-                a.plot(r, t, markerfacecolor=color, marker='.', markersize=10)
+            a.scatter(rot, tilt, s=10 ** 2, c=color, marker='.',
+                      rasterized=True)
         return a
 
     def plotAngularDistributionHistogram(self, title, rot, tilt):
         """ Create an special type of subplot, representing the angular
         distribution of weight projections. """
+        # Deferred imports: this is the only place in the package that
+        # needs scipy, keep it out of the pwem.viewers import chain
+        import matplotlib.cm as cm
+        from scipy.ndimage import gaussian_filter
+
         heatmap, xedges, yedges = np.histogram2d(rot, tilt, bins=100)
         sigma = min(max(xedges) - min(xedges), max(yedges) - min(yedges)) / 20
         heatmap = gaussian_filter(heatmap, sigma=sigma)
@@ -85,20 +97,16 @@ class EmPlotter(Plotter):
             weight: MDL_WEIGHT
         """
         angMd = md.MetaData(mdFile)
-        rot = []
-        tilt = []
+        # Fetch each column in a single binding call instead of
+        # dispatching one getValue per row and label
+        rot = angMd.getColumnValues(md.MDL_ANGLE_ROT)
+        tilt = angMd.getColumnValues(md.MDL_ANGLE_TILT)
 
         if 'histogram' in kwargs:
-            for row in md.iterRows(angMd):
-                rot.append(row.getValue(md.MDL_ANGLE_ROT))
-                tilt.append(row.getValue(md.MDL_ANGLE_TILT))
             return self.plotAngularDistributionHistogram(title, rot, tilt)
         else:
-            weight = []
-            for row in md.iterRows(angMd):
-                rot.append(radians(row.getValue(md.MDL_ANGLE_ROT)))
-                tilt.append(row.getValue(md.MDL_ANGLE_TILT))
-                weight.append(row.getValue(md.MDL_WEIGHT))
+            rot = np.radians(rot)
+            weight = angMd.getColumnValues(md.MDL_WEIGHT)
             return self.plotAngularDistribution(title, rot, tilt, weight, **kwargs)
 
     def plotHist(self, yValues, nbins, color='blue', **kwargs):
@@ -108,6 +116,9 @@ class EmPlotter(Plotter):
 
     def plotScatter(self, xValues, yValues, color='blue', **kwargs):
         """ Create an scatter plot. """
+        # Rasterize by default so vector outputs (pdf reports) do not
+        # grow with the number of points
+        kwargs.setdefault('rasterized', True)
         self.scatterP(xValues, yValues, c=color, **kwargs)
 
     def plotMatrix(self, img
@@ -125,11 +136,11 @@ class EmPlotter(Plotter):
                           vmin=vminData, vmax=vmaxData)
         if xticksLablesMajor is not None:
             plt.xticks(range(len(xticksLablesMajor)),
-                       xticksLablesMajor[:len(xticksLablesMajor)],
+                       xticksLablesMajor,
                        rotation=rotationX)
         if yticksLablesMajor is not None:
             plt.yticks(range(len(yticksLablesMajor)),
-                       yticksLablesMajor[:len(yticksLablesMajor)],
+                       yticksLablesMajor,
                        rotation=rotationY)
         return plot
 
@@ -165,7 +176,7 @@ class EmPlotter(Plotter):
         colors = colorsStr.split()
         lines = linesStr.split()
         markers = markersStr.split()
-        data = PlotData(dbName, dbPreffix, orderColumn, orderDirection)
+        data = PlotData.get(dbName, dbPreffix, orderColumn, orderDirection)
         plotter = Plotter(windowTitle=title)
         ax = plotter.createSubPlot(title, xlabel, ylabel)
         xvalues = data.getColumnValues(xcolumn) if xcolumn else range(0, data.getSize())
@@ -183,7 +194,8 @@ class EmPlotter(Plotter):
                     marker = (markers[i] if not markers[i] == 'none' else None)
                     ax.plot(xvalues, yvalues, color, marker=marker, linestyle=line, label=colLabel)
                 else:
-                    ax.scatter(xvalues, yvalues, c=color, label=col, alpha=0.5)
+                    ax.scatter(xvalues, yvalues, c=color, label=col, alpha=0.5,
+                               rasterized=True)
         ax.legend()
 
         return plotter
@@ -192,6 +204,31 @@ class EmPlotter(Plotter):
 class PlotData:
     """ Small wrapper around table data such as: sqlite or metadata
     files. """
+    _cache = {}  # (fileName, tableName, orderColumn, orderDirection) -> (mtime, instance)
+
+    @classmethod
+    def get(cls, fileName, tableName, orderColumn, orderDirection):
+        """ Return a PlotData for the given file, reusing a previous
+        instance when the file has not changed. Switching between plot
+        columns in the viewer would otherwise reopen and parse the same
+        file once per plot.
+        """
+        key = (fileName, tableName, orderColumn, orderDirection)
+        try:
+            mTime = os.path.getmtime(fileName)
+        except OSError:
+            return cls(*key)  # let the constructor raise its own error
+
+        cached = cls._cache.get(key)
+        if cached is not None and cached[0] == mTime:
+            return cached[1]
+
+        if len(cls._cache) >= 8:
+            cls._cache.clear()
+
+        data = cls(*key)
+        cls._cache[key] = (mTime, data)
+        return data
 
     def __init__(self, fileName, tableName, orderColumn, orderDirection):
         self._orderColumn = orderColumn
@@ -202,6 +239,7 @@ class PlotData:
             self.getColumnValues = self._getValuesFromSet
             self.getSize = self._table.getSize
         else:  # assume a metadata file
+            self._labelCache = {}  # columnName -> label, str2Label is not free
             self._table = self._loadMd(fileName, tableName)
             self.getColumnValues = self._getValuesFromMd
             self.getSize = self._table.size
@@ -220,17 +258,31 @@ class PlotData:
         return setObj
 
     def _getValuesFromSet(self, columnName):
+        if columnName != 'id':
+            try:
+                # Single ordered SELECT over the column, without
+                # building one item object per row
+                return self._table.getColumnValues(
+                    columnName, orderBy=self._orderColumn,
+                    direction=self._orderDirection)
+            except Exception:
+                # Columns not stored flat (e.g. nested attributes of
+                # non-flat mappers) keep the per-item path below
+                pass
         return [self._getValue(obj, columnName)
                 for obj in self._table.iterItems(orderBy=self._orderColumn,
                                                  direction=self._orderDirection)]
 
     @staticmethod
     def _removeInfinites(values):
-        newValues = []
-        for value in values:
-            if isinstance(value, numbers.Number) and value < float("Inf"):
-                newValues.append(value)
-        return newValues
+        try:
+            arr = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Heterogeneous column: keep only the numeric entries
+            arr = np.fromiter((v for v in values
+                               if isinstance(v, numbers.Number)),
+                              dtype=np.float64)
+        return arr[np.isfinite(arr)]
 
     def _loadMd(self, fileName, tableName):
         label = md.str2Label(self._orderColumn)
@@ -240,8 +292,10 @@ class PlotData:
         return tableMd
 
     def _getValuesFromMd(self, columnName):
-        label = md.str2Label(columnName)
-        return [self._table.getValue(label, objId) for objId in self._table]
+        label = self._labelCache.setdefault(columnName,
+                                            md.str2Label(columnName))
+        # One binding call for the whole column instead of one per row
+        return self._table.getColumnValues(label)
 
     def _getValue(self, obj, column):
         if column == 'id':
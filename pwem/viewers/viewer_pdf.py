@@ -24,6 +24,9 @@
 # *
 # **************************************************************************
 
+import os
+import threading
+
 import pyworkflow.viewer as pwviewer
 from pyworkflow.gui.text import _open_cmd
 
@@ -36,4 +39,16 @@ class PDFReportViewer(pwviewer.Viewer):
     _targets = [emprot.ProtPDFReport]
 
     def visualize(self, obj, **kwargs):
-        _open_cmd(obj._getPath("report.pdf"), self.getTkRoot())
+        pdfFile = obj._getPath("report.pdf")
+        # Report a missing file right away, but launch the external
+        # viewer in the background: spawning it can take seconds on a
+        # cold desktop and would freeze the Tk event loop meanwhile
+        if not os.path.isfile(pdfFile):
+            self.errorMessage("Report file '%s' does not exist. "
+                              "Make sure the protocol has finished." % pdfFile,
+                              title="File not found").show()
+            return
+
+        threading.Thread(target=_open_cmd,
+                         args=(pdfFile, self.getTkRoot()),
+                         daemon=True).start()